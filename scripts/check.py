@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""Run SKILL.md validation and the catalog build with a single traversal."""
+import argparse
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from scripts import generate_catalog, validate_skills  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Validate skills and generate the skills.json catalog."
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Fail if skills.json is out of date.",
+    )
+    args = parser.parse_args()
+
+    skill_entries = list(validate_skills.iter_skill_files(ROOT))
+    status = validate_skills.main(skill_entries)
+    if status:
+        return status
+    return generate_catalog.main(["--check"] if args.check else [], skill_entries)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
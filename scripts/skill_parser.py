@@ -0,0 +1,218 @@
+"""Shared SKILL.md frontmatter parsing for the validation and catalog scripts."""
+import functools
+import os
+import pathlib
+import re
+import threading
+from typing import NamedTuple
+
+import orjson
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+ROOT_PREFIX = str(ROOT) + os.sep
+
+FIELD_PATTERN = re.compile(rb"^([ \t]*)([A-Za-z0-9_-]+):[ \t]*(.*)$", re.MULTILINE)
+
+# Real skills are tiny; refuse to read accidentally-committed giants.
+MAX_FILE_SIZE = 1_048_576
+
+# Bump when the parsed representation changes so stale caches are discarded.
+CACHE_VERSION = 1
+CACHE_PATH = ROOT / ".cache" / "skills-parsed.json"
+
+_disk_cache: dict | None = None
+_cache_dirty = False
+_cache_lock = threading.Lock()
+
+
+class ParsedSkill(NamedTuple):
+    fields: dict
+    present: set
+    metadata: dict
+    has_body: bool
+    error: str | None
+
+
+@functools.lru_cache(maxsize=1024)
+def rel_to_root(path) -> str:
+    """Repo-relative posix path via string slicing, no pathlib parsing."""
+    path_str = os.fspath(path)
+    if path_str.startswith(ROOT_PREFIX):
+        path_str = path_str[len(ROOT_PREFIX) :]
+    return path_str.replace(os.sep, "/")
+
+
+@functools.lru_cache(maxsize=1024)
+def normalize_value(value: str) -> str | None:
+    # Values like license and version tokens repeat across skills, so
+    # the cache is warm after the first few files.
+    if value in {"", "|", ">", "|-", ">-"}:
+        return None
+    if (
+        (value.startswith('"') and value.endswith('"'))
+        or (value.startswith("'") and value.endswith("'"))
+    ):
+        return value[1:-1]
+    return value
+
+
+def parse_frontmatter_bytes(data: bytes):
+    """Parse frontmatter from raw file bytes.
+
+    The frontmatter is returned as a raw bytes slice; the body is never
+    decoded or split into lines, just checked for non-whitespace
+    content. Returns ((frontmatter_bytes, has_body), error).
+    """
+    if data.startswith(b"---\n"):
+        start = 4
+    elif data.startswith(b"---\r\n"):
+        start = 5
+    else:
+        return None, "Missing opening frontmatter delimiter '---' on first line"
+
+    end = data.find(b"\n---", start - 1)
+    while end != -1:
+        tail = end + 4
+        if tail == len(data) or data[tail : tail + 1] in (b"\n", b"\r"):
+            break
+        end = data.find(b"\n---", end + 1)
+
+    if end == -1:
+        return None, "Missing closing frontmatter delimiter '---'"
+
+    # Scan past leading whitespace instead of strip(), which would copy
+    # the whole body just to test emptiness.
+    pos = end + 4
+    size = len(data)
+    while pos < size and data[pos] in b" \t\r\n":
+        pos += 1
+    return (data[start:end], pos < size), None
+
+
+def parse_frontmatter_fields(frontmatter: bytes) -> tuple[dict, set, dict]:
+    """Scan frontmatter once, capturing top-level fields and nested blocks.
+
+    A top-level key with an empty value opens a block; subsequent
+    indented key/value lines are collected under it. Returns
+    (fields, present, nested).
+    """
+    fields: dict[str, str | None] = {}
+    present: set[str] = set()
+    nested: dict[str, dict[str, str | None]] = {}
+    current_block: str | None = None
+    # Local bindings keep the per-line loop free of global lookups.
+    normalize = normalize_value
+    add_present = present.add
+    for match in FIELD_PATTERN.finditer(frontmatter):
+        key = match.group(2).decode("utf-8")
+        raw_value = match.group(3).strip().decode("utf-8")
+        if match.group(1):
+            if current_block is not None:
+                nested[current_block][key] = normalize(raw_value)
+            continue
+        add_present(key)
+        fields[key] = normalize(raw_value)
+        if raw_value == "":
+            current_block = key
+            nested[key] = {}
+        else:
+            current_block = None
+    return fields, present, nested
+
+
+def _load_disk_cache() -> dict:
+    # parse_skill runs on thread-pool workers; without the lock, two
+    # threads on a cold start could each build a cache dict and one
+    # would silently drop the other's recorded entries.
+    global _disk_cache
+    with _cache_lock:
+        if _disk_cache is None:
+            try:
+                loaded = orjson.loads(CACHE_PATH.read_bytes())
+            except Exception:
+                loaded = {}
+            # A corrupt cache must never fail the run: reset anything
+            # that is not the expected shape.
+            if (
+                not isinstance(loaded, dict)
+                or loaded.get("version") != CACHE_VERSION
+                or not isinstance(loaded.get("skills"), dict)
+            ):
+                loaded = {"version": CACHE_VERSION, "skills": {}}
+            _disk_cache = loaded
+    return _disk_cache
+
+
+def flush_cache() -> None:
+    """Write the parse cache back to disk if this run changed it."""
+    global _cache_dirty
+    if _cache_dirty and _disk_cache is not None:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_PATH.write_bytes(orjson.dumps(_disk_cache))
+        _cache_dirty = False
+
+
+def _parse_bytes(data: bytes) -> ParsedSkill:
+    parsed, err = parse_frontmatter_bytes(data)
+    if err:
+        return ParsedSkill({}, set(), {}, False, err)
+    frontmatter, has_body = parsed
+    fields, present, nested = parse_frontmatter_fields(frontmatter)
+    return ParsedSkill(fields, present, nested.get("metadata", {}), has_body, None)
+
+
+@functools.lru_cache(maxsize=None)
+def parse_skill(path: pathlib.Path, stat: os.stat_result | None = None) -> ParsedSkill:
+    """Read and parse a SKILL.md file once per process.
+
+    Results are memoized in-process, so running validation and the
+    catalog build together (scripts/check.py) parses each file once,
+    and persisted to .cache/skills-parsed.json keyed by mtime and size,
+    so unchanged files are not reparsed on the next run. Callers that
+    already hold a stat result (the scandir walk) pass it in to avoid
+    a second syscall.
+    """
+    global _cache_dirty
+    if stat is None:
+        try:
+            stat = os.stat(path)
+        except OSError as exc:
+            return ParsedSkill({}, set(), {}, False, f"Failed to read file: {exc}")
+
+    if stat.st_size > MAX_FILE_SIZE:
+        return ParsedSkill(
+            {}, set(), {}, False, f"SKILL.md exceeds {MAX_FILE_SIZE} bytes"
+        )
+
+    cache = _load_disk_cache()["skills"]
+    key = rel_to_root(path)
+    entry = cache.get(key)
+    if (
+        entry is not None
+        and entry["mtime_ns"] == stat.st_mtime_ns
+        and entry["size"] == stat.st_size
+    ):
+        return ParsedSkill(
+            entry["fields"],
+            set(entry["present"]),
+            entry["metadata"],
+            entry["has_body"],
+            entry["error"],
+        )
+
+    try:
+        data = path.read_bytes()
+        parsed = _parse_bytes(data)
+    except Exception as exc:
+        return ParsedSkill({}, set(), {}, False, f"Failed to read file: {exc}")
+    cache[key] = {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "fields": parsed.fields,
+        "present": sorted(parsed.present),
+        "metadata": parsed.metadata,
+        "has_body": parsed.has_body,
+        "error": parsed.error,
+    }
+    _cache_dirty = True
+    return parsed
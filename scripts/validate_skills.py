@@ -1,83 +1,84 @@
 #!/usr/bin/env python3
+import os
 import pathlib
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from scripts import skill_parser  # noqa: E402
 
 SKILL_GLOB = "**/SKILL.md"
-EXCLUDED_DIRS = {"template"}
+EXCLUDED_DIRS = {"template", "node_modules"}
 NAME_PATTERN = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
 MAX_NAME_LENGTH = 64
 MAX_DESC_LENGTH = 1024
 MAX_COMPAT_LENGTH = 500
 
 
-def is_excluded(path: pathlib.Path) -> bool:
-    return any(part in EXCLUDED_DIRS for part in path.parts)
-
-
-def parse_frontmatter(lines):
-    if not lines or lines[0].strip() != "---":
-        return None, "Missing opening frontmatter delimiter '---' on first line"
-
-    end_idx = None
-    for idx in range(1, len(lines)):
-        if lines[idx].strip() == "---":
-            end_idx = idx
-            break
-
-    if end_idx is None:
-        return None, "Missing closing frontmatter delimiter '---'"
-
-    frontmatter_lines = lines[1:end_idx]
-    body_lines = lines[end_idx + 1 :]
-    return (frontmatter_lines, body_lines), None
+def max_workers() -> int:
+    return min(32, (os.cpu_count() or 1) * 4)
 
 
-def normalize_value(value: str) -> str | None:
-    if value in {"", "|", ">", "|-", ">-"}:
-        return None
-    if (
-        (value.startswith('"') and value.endswith('"'))
-        or (value.startswith("'") and value.endswith("'"))
-    ):
-        return value[1:-1]
-    return value
-
-
-def parse_frontmatter_fields(frontmatter_lines: list[str]) -> tuple[dict, set]:
-    fields: dict[str, str | None] = {}
-    present: set[str] = set()
-    for line in frontmatter_lines:
-        if not line.strip():
-            continue
-        if line.startswith((" ", "\t")):
-            continue
-        match = re.match(r"^([A-Za-z0-9_-]+):\s*(.*)$", line)
-        if not match:
-            continue
-        key = match.group(1)
-        raw_value = match.group(2).strip()
-        present.add(key)
-        fields[key] = normalize_value(raw_value)
-    return fields, present
+def is_valid_name(name: str) -> bool:
+    # Fast string-op path: well-formed names never enter the regex
+    # engine. Anything that falls through is settled by NAME_PATTERN.
+    if name.isascii() and name.islower() and name.replace("-", "").isalnum():
+        return (
+            "--" not in name
+            and not name.startswith("-")
+            and not name.endswith("-")
+        )
+    return NAME_PATTERN.fullmatch(name) is not None
+
+
+def iter_skill_files(root: pathlib.Path):
+    """Yield (SKILL.md path, marketplace.json path or None, stat) tuples.
+
+    Uses os.scandir directly instead of Path.rglob so directory entries
+    are filtered from the scandir cache without a stat or Path object
+    per entry. Excluded, hidden, and vendor directories are pruned
+    before descent, so their subtrees are never scanned. The sibling
+    marketplace.json and the SKILL.md stat result are captured while
+    the directory entry is at hand, saving callers a syscall per skill.
+    """
+    stack = [str(root)]
+    # Local bindings keep the per-entry loop free of global lookups.
+    scandir = os.scandir
+    excluded = EXCLUDED_DIRS
+    push = stack.append
+    while stack:
+        skill_path = None
+        skill_stat = None
+        marketplace_path = None
+        with scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in excluded or entry.name.startswith("."):
+                        continue
+                    push(entry.path)
+                elif entry.name == "SKILL.md" and entry.is_file():
+                    skill_path = entry.path
+                    skill_stat = entry.stat()
+                elif entry.name == "marketplace.json" and entry.is_file():
+                    marketplace_path = entry.path
+        if skill_path is not None:
+            yield (
+                pathlib.Path(skill_path),
+                pathlib.Path(marketplace_path) if marketplace_path else None,
+                skill_stat,
+            )
 
 
-def validate_skill(path: pathlib.Path) -> list[str]:
+def validate_skill(path: pathlib.Path, stat: os.stat_result | None = None) -> list[str]:
     errors = []
-    try:
-        text = path.read_text(encoding="utf-8")
-    except Exception as exc:
-        return [f"Failed to read file: {exc}"]
-
-    lines = text.splitlines()
-    parsed, err = parse_frontmatter(lines)
-    if err:
-        return [err]
+    parsed = skill_parser.parse_skill(path, stat)
+    if parsed.error:
+        return [parsed.error]
 
-    frontmatter_lines, body_lines = parsed
-    fields, present = parse_frontmatter_fields(frontmatter_lines)
+    fields, present = parsed.fields, parsed.present
 
     name_value = fields.get("name")
     if "name" not in present:
@@ -87,12 +88,12 @@ def validate_skill(path: pathlib.Path) -> list[str]:
     else:
         if len(name_value) > MAX_NAME_LENGTH:
             errors.append(f"Frontmatter field 'name' exceeds {MAX_NAME_LENGTH} chars")
-        if not NAME_PATTERN.match(name_value):
+        if not is_valid_name(name_value):
             errors.append(
                 "Frontmatter field 'name' must be lowercase letters, numbers, "
                 "and single hyphens only"
             )
-        if path.parent.name != name_value:
+        if os.path.basename(os.path.dirname(os.fspath(path))) != name_value:
             errors.append(
                 "Frontmatter field 'name' must match the parent directory name"
             )
@@ -118,28 +119,31 @@ def validate_skill(path: pathlib.Path) -> list[str]:
                 f"Frontmatter field 'compatibility' exceeds {MAX_COMPAT_LENGTH} chars"
             )
 
-    body_text = "\n".join(body_lines).strip()
-    if not body_text:
+    if not parsed.has_body:
         errors.append("Missing markdown content after frontmatter")
 
     return errors
 
 
-def main():
-    skill_files = [
-        p for p in ROOT.rglob(SKILL_GLOB) if p.is_file() and not is_excluded(p)
-    ]
+def main(skill_entries=None):
+    if skill_entries is None:
+        skill_entries = list(iter_skill_files(ROOT))
 
-    if not skill_files:
+    if not skill_entries:
         print("No SKILL.md files found.")
         return 1
 
+    skill_files = [skill_file for skill_file, _marketplace, _stat in skill_entries]
+    skill_stats = [stat for _skill_file, _marketplace, stat in skill_entries]
     all_errors = []
-    for path in skill_files:
-        errors = validate_skill(path)
-        if errors:
+    with ThreadPoolExecutor(max_workers=max_workers()) as executor:
+        for path, errors in zip(
+            skill_files, executor.map(validate_skill, skill_files, skill_stats)
+        ):
             for err in errors:
-                all_errors.append(f"{path.relative_to(ROOT)}: {err}")
+                all_errors.append(f"{skill_parser.rel_to_root(path)}: {err}")
+
+    skill_parser.flush_cache()
 
     if all_errors:
         print("Skill validation failed:")
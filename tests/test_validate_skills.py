@@ -1,31 +1,43 @@
+import shutil
 import tempfile
 import textwrap
 import unittest
+import uuid
 from pathlib import Path
 
-from scripts import validate_skills
+from scripts import skill_parser, validate_skills
 
 
 class ValidateSkillsTests(unittest.TestCase):
-    def setUp(self):
-        self._temp_dirs = []
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_root = tempfile.mkdtemp()
 
-    def tearDown(self):
-        for temp_dir in self._temp_dirs:
-            temp_dir.cleanup()
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._temp_root)
 
-    def test_parse_frontmatter_missing_opening(self):
-        lines = ["name: test", "---", "content"]
-        parsed, err = validate_skills.parse_frontmatter(lines)
+    def test_parse_frontmatter_bytes_missing_opening(self):
+        data = b"name: test\n---\ncontent\n"
+        parsed, err = skill_parser.parse_frontmatter_bytes(data)
         self.assertIsNone(parsed)
         self.assertIn("opening frontmatter", err)
 
-    def test_parse_frontmatter_missing_closing(self):
-        lines = ["---", "name: test", "description: ok"]
-        parsed, err = validate_skills.parse_frontmatter(lines)
+    def test_parse_frontmatter_bytes_missing_closing(self):
+        data = b"---\nname: test\ndescription: ok\n"
+        parsed, err = skill_parser.parse_frontmatter_bytes(data)
         self.assertIsNone(parsed)
         self.assertIn("closing frontmatter", err)
 
+    def test_parse_frontmatter_bytes_accepts_crlf(self):
+        data = b"---\r\nname: test\r\ndescription: ok\r\n---\r\n\r\nBody\r\n"
+        parsed, err = skill_parser.parse_frontmatter_bytes(data)
+        self.assertIsNone(err)
+        frontmatter, has_body = parsed
+        fields, _present, _nested = skill_parser.parse_frontmatter_fields(frontmatter)
+        self.assertEqual(fields, {"name": "test", "description": "ok"})
+        self.assertTrue(has_body)
+
     def test_validate_skill_requires_name_and_description(self):
         content = textwrap.dedent(
             """\
@@ -86,6 +98,31 @@ class ValidateSkillsTests(unittest.TestCase):
         errors = validate_skills.validate_skill(path)
         self.assertIn("lowercase", " ".join(errors))
 
+    def test_validate_skill_rejects_oversized_file(self):
+        content = textwrap.dedent(
+            """\
+            ---
+            name: test-skill
+            description: ok
+            ---
+
+            # Title
+            Body
+            """
+        )
+        content += "x" * 1_048_576
+        path = self._write_temp_skill(content)
+        errors = validate_skills.validate_skill(path)
+        self.assertIn("exceeds", " ".join(errors))
+
+    def test_validate_skill_reports_invalid_utf8(self):
+        path = self._write_temp_skill("placeholder")
+        path.write_bytes(
+            b"---\nname: test-skill\ndescription: \xff\xfe\n---\n\nBody\n"
+        )
+        errors = validate_skills.validate_skill(path)
+        self.assertIn("Failed to read file", " ".join(errors))
+
     def test_validate_skill_happy_path(self):
         content = textwrap.dedent(
             """\
@@ -103,9 +140,7 @@ class ValidateSkillsTests(unittest.TestCase):
         self.assertEqual(errors, [])
 
     def _write_temp_skill(self, content: str, dir_name: str = "test-skill") -> Path:
-        temp_dir = tempfile.TemporaryDirectory()
-        self._temp_dirs.append(temp_dir)
-        skill_dir = Path(temp_dir.name) / dir_name
+        skill_dir = Path(self._temp_root) / uuid.uuid4().hex / dir_name
         skill_dir.mkdir(parents=True, exist_ok=True)
         path = skill_dir / "SKILL.md"
         path.write_text(content, encoding="utf-8")